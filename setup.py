@@ -92,4 +92,8 @@ setup(
     packages=find_packages(include=[PACKAGE_NAME, PACKAGE_NAME + '.*']),
 
     install_requires=INSTALLATION_REQUIREMENTS,
+
+    extras_require={
+        'orjson': ['orjson'],
+    },
 )
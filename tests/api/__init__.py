@@ -23,6 +23,7 @@ SOFTWARE.
 """
 
 import os
+import weakref
 
 import pytest
 import requests
@@ -43,7 +44,8 @@ from webexteamssdk.api.teams import TeamsAPI
 from webexteamssdk.api.webhooks import WebhooksAPI
 from webexteamssdk.config import (
     ACCESS_TOKEN_ENVIRONMENT_VARIABLE, DEFAULT_BASE_URL,
-    DEFAULT_SINGLE_REQUEST_TIMEOUT, DEFAULT_WAIT_ON_RATE_LIMIT,
+    DEFAULT_MAX_CONCURRENCY, DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_WAIT_ON_RATE_LIMIT,
 )
 
 
@@ -74,6 +76,12 @@ def unset_access_token(access_token):
     os.environ[ACCESS_TOKEN_ENVIRONMENT_VARIABLE] = access_token
 
 
+@pytest.fixture
+def shared_connection_pool():
+    yield None
+    webexteamssdk.WebexTeamsAPI.close_shared_connection_pool()
+
+
 @pytest.fixture(scope="session")
 def api(access_token):
     return webexteamssdk.WebexTeamsAPI(access_token=access_token)
@@ -81,6 +89,11 @@ def api(access_token):
 
 # Tests
 
+def test_api_classes_importable_from_package():
+    assert webexteamssdk.api.RoomsAPI is RoomsAPI
+    assert webexteamssdk.api.WebhooksAPI is WebhooksAPI
+
+
 # Test creating WebexTeamsAPI objects
 
 @pytest.mark.usefixtures("unset_access_token")
@@ -147,6 +160,70 @@ def test_non_default_wait_on_rate_limit():
         DEFAULT_WAIT_ON_RATE_LIMIT
 
 
+@pytest.mark.usefixtures("access_token")
+def test_zero_rate_limit_rpm_raises_error():
+    with pytest.raises(ValueError):
+        webexteamssdk.WebexTeamsAPI(rate_limit_rpm=0)
+
+
+@pytest.mark.usefixtures("access_token")
+def test_api_object_can_be_weakly_referenced():
+    connection_object = webexteamssdk.WebexTeamsAPI()
+    assert weakref.ref(connection_object)() is connection_object
+
+
+@pytest.mark.usefixtures("access_token")
+def test_default_max_concurrency():
+    connection_object = webexteamssdk.WebexTeamsAPI()
+    assert connection_object.max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+
+@pytest.mark.usefixtures("access_token")
+def test_custom_max_concurrency():
+    connection_object = webexteamssdk.WebexTeamsAPI(max_concurrency=4)
+    assert connection_object.max_concurrency == 4
+
+
+@pytest.mark.usefixtures("access_token", "shared_connection_pool")
+def test_shared_connection_pool():
+    connection_object_1 = webexteamssdk.WebexTeamsAPI(
+        shared_connection_pool=True
+    )
+    connection_object_2 = webexteamssdk.WebexTeamsAPI(
+        shared_connection_pool=True
+    )
+    assert connection_object_1._session._adapter is not None
+    assert connection_object_1._session._adapter is \
+        connection_object_2._session._adapter
+
+
+@pytest.mark.usefixtures("access_token", "shared_connection_pool")
+def test_adapter_kwargs_with_shared_connection_pool_raises_error():
+    with pytest.raises(ValueError):
+        webexteamssdk.WebexTeamsAPI(
+            shared_connection_pool=True,
+            adapter_kwargs={"pool_maxsize": 32},
+        )
+
+
+def test_close_shared_connection_pool():
+    webexteamssdk.WebexTeamsAPI.configure_shared_connection_pool()
+    webexteamssdk.WebexTeamsAPI.close_shared_connection_pool()
+    assert webexteamssdk.WebexTeamsAPI._shared_adapter is None
+
+
+@pytest.mark.usefixtures("access_token")
+def test_create_factory():
+    connection_object = webexteamssdk.WebexTeamsAPI.create()
+    assert isinstance(connection_object, webexteamssdk.WebexTeamsAPI)
+
+
+@pytest.mark.usefixtures("access_token")
+def test_context_manager():
+    with webexteamssdk.WebexTeamsAPI() as connection_object:
+        assert isinstance(connection_object, webexteamssdk.WebexTeamsAPI)
+
+
 # Test creation of component API objects
 def test_access_tokens_api_object_creation(api):
     assert isinstance(api.access_tokens, AccessTokensAPI)
@@ -198,3 +275,7 @@ def test_teams_api_object_creation(api):
 
 def test_webhooks_api_object_creation(api):
     assert isinstance(api.webhooks, WebhooksAPI)
+
+
+def test_api_objects_are_created_once(api):
+    assert api.people is api.people
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/models/immutable.py Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import pickle
+import weakref
+
+import pytest
+
+from webexteamssdk.models.immutable import ImmutableData, Room
+
+
+# Constants
+ROOM_JSON = {"id": "room-id", "title": "Room", "creator": {"id": "person"}}
+
+
+# Tests
+def test_attributes_read_from_json_data():
+    room = Room(ROOM_JSON)
+
+    assert room.id == "room-id"
+    assert room.title == "Room"
+    assert isinstance(room.creator, ImmutableData)
+    assert room.creator.id == "person"
+
+
+def test_missing_attribute_raises_error():
+    room = Room(ROOM_JSON)
+
+    with pytest.raises(AttributeError):
+        room.not_an_attribute
+
+
+def test_new_attributes_not_allowed():
+    room = Room(ROOM_JSON)
+
+    with pytest.raises(AttributeError):
+        room.new_attribute = True
+
+
+def test_weak_reference():
+    room = Room(ROOM_JSON)
+
+    assert weakref.ref(room)() is room
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(protocol):
+    room = Room(ROOM_JSON)
+
+    unpickled = pickle.loads(pickle.dumps(room, protocol))
+
+    assert isinstance(unpickled, Room)
+    assert unpickled == room
+    assert unpickled.title == "Room"
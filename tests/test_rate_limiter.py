@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/rate_limiter.py Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import time
+
+import requests
+
+from webexteamssdk.rate_limiter import (
+    AdmissionController, SlidingWindowLimiter,
+)
+
+
+# Helper Functions
+def make_response(status_code, headers=None):
+    """Create a requests.Response with the provided status code."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+# Tests
+def test_acquire_records_requests():
+    limiter = SlidingWindowLimiter(rpm=5)
+    for _ in range(5):
+        limiter.acquire()
+    assert len(limiter._request_times) == 5
+
+
+def test_rate_limit_response_pauses_requests():
+    limiter = SlidingWindowLimiter(rpm=5)
+    limiter.update(make_response(429, {"Retry-After": "30"}))
+    assert limiter._paused_until > time.time() + 25
+
+
+def test_low_remaining_pauses_requests():
+    limiter = SlidingWindowLimiter(rpm=300)
+    limiter.update(make_response(200, {
+        "X-RateLimit-Limit": "300",
+        "X-RateLimit-Remaining": "1",
+    }))
+    assert limiter._paused_until > time.time()
+
+
+def test_remaining_headers_ignored_when_not_low():
+    limiter = SlidingWindowLimiter(rpm=300)
+    limiter.update(make_response(200, {
+        "X-RateLimit-Limit": "300",
+        "X-RateLimit-Remaining": "100",
+    }))
+    assert limiter._paused_until == 0
+
+
+def test_admission_controller_limit_adjustment():
+    controller = AdmissionController(c_min=1, c_max=4, alpha=1, beta=0.5)
+    assert controller.limit == 1
+    controller.report(latency=0.1, status_code=200)
+    controller.report(latency=0.1, status_code=200)
+    assert controller.limit == 3
+    controller.report(latency=0.1, status_code=429)
+    assert controller.limit == 1.5
+    controller.report(latency=0.1, status_code=503)
+    assert controller.limit == 1
+
+
+def test_admission_controller_slots():
+    controller = AdmissionController(c_min=2, c_max=2)
+    controller.acquire()
+    controller.acquire()
+    assert controller.in_flight == 2
+    controller.release()
+    controller.release()
+    assert controller.in_flight == 0
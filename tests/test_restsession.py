@@ -23,17 +23,72 @@ SOFTWARE.
 """
 
 
+import json
 import logging
+import threading
+import time
 import warnings
 
 import pytest
+import requests
+from requests_toolbelt import MultipartEncoder
 
 import webexteamssdk
+from webexteamssdk import restsession
+from webexteamssdk.restsession import RestSession
 
 
 logging.captureWarnings(True)
 
 
+# Constants
+BASE_URL = "https://webexapis.com/v1/"
+
+
+# Helper Classes
+class ScriptedAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter that replays a script instead of using the network.
+
+    Each script entry is either an exception class, which is raised for the
+    request (as HTTPAdapter does), or a status code, which is returned as an
+    empty JSON response.  Each response takes `delay` seconds.
+    """
+
+    def __init__(self, *script):
+        super(ScriptedAdapter, self).__init__()
+        self.script = list(script)
+        self.requests = []
+        self.send_times = []
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            self.send_times.append(time.time())
+            entry = self.script.pop(0)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+        if isinstance(entry, type):
+            raise entry(request=request)
+
+        response = requests.Response()
+        response.status_code = entry
+        response.headers["Content-Type"] = "application/json"
+        response._content = b"{}"
+        response.url = request.url
+        response.request = request
+        return response
+
+
 # Helper Functions
 def rate_limit_detected(w):
     """Check to see if a rate-limit warning is in the warnings list."""
@@ -43,6 +98,16 @@ def rate_limit_detected(w):
     return False
 
 
+def scripted_session(*script, **kwargs):
+    """Return a RestSession whose requests are answered by `script`."""
+    adapter = ScriptedAdapter(*script)
+    kwargs.setdefault(
+        "retry_policy", webexteamssdk.RetryAfterBackoffPolicy(base=0.001),
+    )
+    session = RestSession("token", BASE_URL, adapter=adapter, **kwargs)
+    return session, adapter
+
+
 # Tests
 @pytest.mark.slow
 def test_rate_limit_retry(api, list_of_rooms, add_rooms):
@@ -59,3 +124,253 @@ def test_rate_limit_retry(api, list_of_rooms, add_rooms):
                 break
 
     api._session.wait_on_rate_limit = original_wait_on_rate_limit
+
+
+def test_headers_do_not_create_session():
+    session = RestSession("token", BASE_URL)
+
+    headers = session.headers
+
+    assert session._requests_session is None
+    assert headers["Authorization"] == "Bearer token"
+    assert "User-Agent" in headers
+    assert headers == session._req_session.headers
+
+
+def test_headers_include_session_kwargs_headers():
+    session = RestSession(
+        "token", BASE_URL, session_kwargs={"headers": {"X-Custom": "1"}},
+    )
+
+    headers = session.headers
+
+    assert session._requests_session is None
+    assert headers["X-Custom"] == "1"
+    assert headers == session._req_session.headers
+
+
+def test_get_retried_after_server_error():
+    session, adapter = scripted_session(503, 200)
+
+    response = session.request("GET", "rooms", 200)
+
+    assert response.status_code == 200
+    assert len(adapter.requests) == 2
+
+
+def test_post_not_retried_after_server_error():
+    session, adapter = scripted_session(503, 200)
+
+    with pytest.raises(webexteamssdk.ApiError):
+        session.request("POST", "messages", 200, json={})
+
+    assert len(adapter.requests) == 1
+
+
+def test_rate_limit_raised_when_not_waiting():
+    session, adapter = scripted_session(429, 200, wait_on_rate_limit=False)
+
+    with pytest.raises(webexteamssdk.RateLimitError):
+        session.request("GET", "rooms", 200)
+
+    assert len(adapter.requests) == 1
+
+
+def test_get_retried_after_connection_error():
+    session, adapter = scripted_session(
+        requests.exceptions.ConnectionError, 200,
+    )
+
+    response = session.request("GET", "rooms", 200)
+
+    assert response.status_code == 200
+    assert len(adapter.requests) == 2
+
+
+def test_unknown_session_attribute_raises_error():
+    with pytest.raises(ValueError):
+        RestSession("token", BASE_URL, session_kwargs={"not_an_attr": True})
+
+
+def test_adapter_kwargs_with_adapter_raises_error():
+    with pytest.raises(ValueError):
+        RestSession(
+            "token", BASE_URL,
+            adapter=requests.adapters.HTTPAdapter(),
+            adapter_kwargs={"pool_maxsize": 32},
+        )
+
+
+def test_session_kwargs_applied_to_session():
+    session = RestSession("token", BASE_URL, session_kwargs={"verify": False})
+
+    assert session._req_session.verify is False
+
+
+def test_adapter_kwargs_applied_to_mounted_adapter():
+    session = RestSession(
+        "token", BASE_URL, adapter_kwargs={"pool_maxsize": 32},
+    )
+
+    adapter = session._req_session.get_adapter(BASE_URL)
+
+    assert adapter._pool_maxsize == 32
+
+
+def test_idempotency_key_reused_across_retries():
+    session, adapter = scripted_session(
+        503, 503, 200, 200, idempotency_keys=True,
+    )
+
+    session.request("POST", "messages", 200, json={})
+    session.request("POST", "messages", 200, json={})
+
+    keys = [request.headers["Idempotency-Key"] for request in adapter.requests]
+    assert len(adapter.requests) == 4
+    assert keys[0] == keys[1] == keys[2]
+    assert keys[3] != keys[0]
+
+
+def test_no_idempotency_key_by_default():
+    session, adapter = scripted_session(200)
+
+    session.request("POST", "messages", 200, json={})
+
+    assert "Idempotency-Key" not in adapter.requests[0].headers
+
+
+@pytest.mark.skipif(restsession.orjson is None, reason="orjson not installed")
+def test_post_json_encoded_with_orjson():
+    session, adapter = scripted_session(200)
+
+    session.post("messages", json={"text": "Hello", 1: "one"})
+
+    body = json.loads(adapter.requests[0].body)
+    assert body == {"text": "Hello", "1": "one"}
+
+
+def test_post_json_falls_back_to_stdlib(monkeypatch):
+    # orjson can't encode integers larger than 64 bits; json can
+    session, adapter = scripted_session(200, 200)
+    big_number = 2 ** 70
+
+    session.post("messages", json={"number": big_number})
+    monkeypatch.setattr(restsession, "orjson", None)
+    session.post("messages", json={"number": big_number})
+
+    for request in adapter.requests:
+        assert json.loads(request.body) == {"number": big_number}
+
+
+def test_rate_limits_do_not_use_up_retries(monkeypatch):
+    monkeypatch.setattr(restsession.time, "sleep", lambda seconds: None)
+    session, adapter = scripted_session(
+        429, 429, 503, 200,
+        retry_policy=webexteamssdk.RetryAfterBackoffPolicy(max_retries=1),
+    )
+
+    with warnings.catch_warnings(record=True):
+        response = session.request("GET", "rooms", 200)
+
+    assert response.status_code == 200
+    assert len(adapter.requests) == 4
+
+
+def test_custom_policy_waits_on_rate_limit(monkeypatch):
+    class PacingPolicy(webexteamssdk.RetryPolicy):
+        def before_request(self):
+            pass
+
+    monkeypatch.setattr(restsession.time, "sleep", lambda seconds: None)
+    session, adapter = scripted_session(
+        429, 200, retry_policy=PacingPolicy(), wait_on_rate_limit=True,
+    )
+
+    with warnings.catch_warnings(record=True) as w:
+        response = session.request("GET", "rooms", 200)
+
+    assert response.status_code == 200
+    assert rate_limit_detected(w)
+
+
+def test_default_adapter_pools_a_connection_per_concurrent_request():
+    session = RestSession("token", BASE_URL, max_concurrency=32)
+
+    adapter = session._req_session.get_adapter(BASE_URL)
+
+    assert adapter._pool_maxsize == 32
+
+
+def test_min_interval_spaces_out_requests():
+    session, adapter = scripted_session(200, 200, 200, min_interval_s=0.05)
+
+    for _ in range(3):
+        session.request("GET", "rooms", 200)
+
+    intervals = [
+        later - earlier
+        for earlier, later in zip(adapter.send_times, adapter.send_times[1:])
+    ]
+    assert all(interval >= 0.04 for interval in intervals)
+
+
+def test_max_concurrency_caps_requests_in_flight():
+    session, adapter = scripted_session(*[200] * 8, max_concurrency=2)
+    adapter.delay = 0.05
+
+    threads = [
+        threading.Thread(target=session.request, args=("GET", "rooms", 200))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(adapter.requests) == 8
+    assert adapter.max_in_flight == 2
+
+
+def test_multipart_upload_not_retried_with_idempotency_key():
+    session, adapter = scripted_session(503, 200, idempotency_keys=True)
+    multipart_data = MultipartEncoder({
+        "roomId": "room-id",
+        "files": ("hello.txt", b"Hello, World!", "text/plain"),
+    })
+
+    with pytest.raises(webexteamssdk.ApiError):
+        session.post(
+            "messages", data=multipart_data,
+            headers={"Content-type": multipart_data.content_type},
+        )
+
+    assert len(adapter.requests) == 1
+
+
+def test_admission_controller_reports_responses():
+    controller = webexteamssdk.AdmissionController(initial_concurrency=8)
+    session, adapter = scripted_session(
+        200, 503, 200, admission_controller=controller,
+    )
+
+    session.request("GET", "rooms", 200)
+    assert controller.in_flight == 0
+    assert controller.limit > 8
+
+    limit = controller.limit
+    session.request("GET", "rooms", 200)
+    assert controller.in_flight == 0
+    assert controller.limit < limit
+
+
+def test_admission_controller_reports_latency():
+    controller = webexteamssdk.AdmissionController(
+        initial_concurrency=8, latency_target_s=0.01,
+    )
+    session, adapter = scripted_session(200, admission_controller=controller)
+    adapter.delay = 0.05
+
+    session.request("GET", "rooms", 200)
+
+    assert controller.in_flight == 0
+    assert controller.limit < 8
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/retry.py Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import requests
+
+import webexteamssdk
+from webexteamssdk.retry import (
+    classify, FATAL, parse_retry_after, RATE_LIMIT, RETRY,
+)
+
+
+# Helper Functions
+def make_response(status_code, method="GET", headers=None,
+                  request_headers=None):
+    """Create a requests.Response with the provided status code."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.request = requests.Request(
+        method, "https://webexapis.com/v1/rooms", headers=request_headers,
+    ).prepare()
+    response.headers.update(headers or {})
+    return response
+
+
+# Tests
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("10") == 10
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_parse_retry_after_invalid():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_rate_limit_retry_delay():
+    policy = webexteamssdk.RetryAfterBackoffPolicy()
+    response = make_response(429, headers={"Retry-After": "7"})
+    assert policy.get_retry_delay(response, 0) == 7
+
+
+def test_base_policy_retry_delay():
+    policy = webexteamssdk.RetryPolicy()
+    response = make_response(429, headers={"Retry-After": "7"})
+    assert policy.get_retry_delay(response, 0) == 7
+    assert policy.get_retry_delay(make_response(503), 0) is None
+
+
+def test_server_error_retry_delay():
+    policy = webexteamssdk.RetryAfterBackoffPolicy(
+        max_retries=2, base=1, jitter=None,
+    )
+    response = make_response(503)
+    assert policy.get_retry_delay(response, 0) == 1
+    assert policy.get_retry_delay(response, 1) == 2
+    assert policy.get_retry_delay(response, 2) is None
+
+
+def test_server_error_not_retried_for_post():
+    policy = webexteamssdk.RetryAfterBackoffPolicy()
+    assert policy.get_retry_delay(make_response(503, "POST"), 0) is None
+
+
+def test_server_error_retried_for_post_with_idempotency_key():
+    policy = webexteamssdk.RetryAfterBackoffPolicy()
+    response = make_response(
+        503, "POST", request_headers={"Idempotency-Key": "abc123"},
+    )
+    assert policy.get_retry_delay(response, 0) is not None
+
+
+def test_client_error_not_retried():
+    policy = webexteamssdk.RetryAfterBackoffPolicy()
+    assert policy.get_retry_delay(make_response(400), 0) is None
+
+
+def test_aimd_rate_adjustment():
+    policy = webexteamssdk.AIMDPolicy(alpha=1, beta=0.5, initial_rate=10)
+    policy.after_response(make_response(200), latency=0.1)
+    assert policy.rate == 11
+    policy.after_response(make_response(429), latency=0.1)
+    assert policy.rate == 5.5
+    policy.after_response(make_response(200), latency=5)
+    assert policy.rate == 2.75
+
+
+def test_classify_responses():
+    assert classify(make_response(429)) == RATE_LIMIT
+    assert classify(make_response(503)) == RETRY
+    for status_code in (400, 401, 403, 404, 422):
+        assert classify(make_response(status_code)) == FATAL
+
+
+def test_classify_exceptions():
+    assert classify(requests.exceptions.ConnectionError()) == RETRY
+    assert classify(requests.exceptions.ReadTimeout()) == RETRY
+    assert classify(requests.exceptions.SSLError()) == FATAL
+    assert classify(requests.exceptions.ProxyError()) == FATAL
+    assert classify(webexteamssdk.AccessTokenError()) == FATAL
+
+
+def test_connection_error_retry_delay():
+    policy = webexteamssdk.RetryAfterBackoffPolicy(max_retries=1)
+    request = make_response(200).request
+    exception = requests.exceptions.ConnectionError(request=request)
+    assert policy.get_exception_retry_delay(exception, 0) is not None
+    assert policy.get_exception_retry_delay(exception, 1) is None
+
+
+def test_ssl_error_not_retried():
+    policy = webexteamssdk.RetryAfterBackoffPolicy()
+    request = make_response(200).request
+    exception = requests.exceptions.SSLError(request=request)
+    assert policy.get_exception_retry_delay(exception, 0) is None
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/utils.py Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from collections import OrderedDict
+
+import pytest
+import requests
+
+from webexteamssdk import utils
+
+
+# Helper Functions
+def make_response(content):
+    """Return a requests.Response with the given JSON body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+# Tests
+@pytest.mark.skipif(utils.orjson is None, reason="orjson not installed")
+def test_extract_and_parse_json_with_orjson():
+    response = make_response(b'{"id": "1", "title": "Caf\xc3\xa9"}')
+
+    assert utils.extract_and_parse_json(response) == {
+        "id": "1", "title": u"Café",
+    }
+
+
+def test_extract_and_parse_json_with_stdlib(monkeypatch):
+    monkeypatch.setattr(utils, "orjson", None)
+    response = make_response(b'{"id": "1", "title": "Caf\xc3\xa9"}')
+
+    data = utils.extract_and_parse_json(response)
+
+    assert isinstance(data, OrderedDict)
+    assert data == {"id": "1", "title": u"Café"}
@@ -40,6 +40,12 @@ class TestWebexTeamsSDK:
         assert hasattr(webexteamssdk, "RateLimitWarning")
         assert hasattr(webexteamssdk, "webexteamssdkException")
 
+        # Retry Policies
+        assert hasattr(webexteamssdk, "RetryPolicy")
+        assert hasattr(webexteamssdk, "RetryAfterBackoffPolicy")
+        assert hasattr(webexteamssdk, "AIMDPolicy")
+        assert hasattr(webexteamssdk, "AdmissionController")
+
         # Data Models
         assert hasattr(webexteamssdk, "dict_data_factory")
         assert hasattr(webexteamssdk, "AccessToken")
@@ -49,6 +49,8 @@ from .models.immutable import (
     Role, Room, RoomMeetingInfo, Team, TeamMembership, Webhook, WebhookEvent,
 )
 from .models.simple import simple_data_factory, SimpleDataModel
+from .rate_limiter import AdmissionController
+from .retry import AIMDPolicy, RetryAfterBackoffPolicy, RetryPolicy
 from .utils import WebexTeamsDateTime
 
 
@@ -22,33 +22,54 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import threading
+
 from past.types import basestring
+from requests.adapters import HTTPAdapter
 
 from webexteamssdk.config import (
-    DEFAULT_BASE_URL, DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_BASE_URL, DEFAULT_MAX_CONCURRENCY, DEFAULT_SINGLE_REQUEST_TIMEOUT,
     DEFAULT_WAIT_ON_RATE_LIMIT,
 )
 from webexteamssdk.environment import WEBEX_TEAMS_ACCESS_TOKEN
 from webexteamssdk.exceptions import AccessTokenError
 from webexteamssdk.models.immutable import immutable_data_factory
+from webexteamssdk.rate_limiter import (
+    AdmissionController, SlidingWindowLimiter,
+)
 from webexteamssdk.restsession import RestSession
+from webexteamssdk.retry import RetryPolicy
 from webexteamssdk.utils import check_type
 from .access_tokens import AccessTokensAPI
-from .admin_audit_events import AdminAuditEventsAPI
-from .attachment_actions import AttachmentActionsAPI
-from .events import EventsAPI
-from .guest_issuer import GuestIssuerAPI
-from .licenses import LicensesAPI
-from .memberships import MembershipsAPI
-from .messages import MessagesAPI
-from .organizations import OrganizationsAPI
-from .people import PeopleAPI
-from .roles import RolesAPI
-from .rooms import RoomsAPI
-from .team_memberships import TeamMembershipsAPI
-from .teams import TeamsAPI
-from .webhooks import WebhooksAPI
+import importlib
 import os
+import sys
+
+
+_shared_adapter_lock = threading.Lock()
+
+
+def _import_class(import_path):
+    """Import and return a class from a "module:class" import path."""
+    module_name, class_name = import_path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name):
+    """Lazily import the API wrapper classes (PEP 562; Python 3.7+).
+
+    Older Python versions import the classes when this module is loaded; see
+    the end of this module.
+    """
+    for import_path in WebexTeamsAPI._API_MAP.values():
+        if import_path.endswith(":" + name):
+            api_class = _import_class(import_path)
+            globals()[name] = api_class
+            return api_class
+
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
 
 
 class WebexTeamsAPI(object):
@@ -62,6 +83,66 @@ class WebexTeamsAPI(object):
     them in a simple hierarchical structure.
     """
 
+    # Map of API wrapper attribute names to the "module:class" import paths
+    # of their wrapper classes.  The wrapper modules are imported, and the
+    # wrappers created, the first time they are accessed.
+    _API_MAP = {
+        "admin_audit_events":
+            "webexteamssdk.api.admin_audit_events:AdminAuditEventsAPI",
+        "attachment_actions":
+            "webexteamssdk.api.attachment_actions:AttachmentActionsAPI",
+        "events": "webexteamssdk.api.events:EventsAPI",
+        "guest_issuer": "webexteamssdk.api.guest_issuer:GuestIssuerAPI",
+        "licenses": "webexteamssdk.api.licenses:LicensesAPI",
+        "memberships": "webexteamssdk.api.memberships:MembershipsAPI",
+        "messages": "webexteamssdk.api.messages:MessagesAPI",
+        "organizations": "webexteamssdk.api.organizations:OrganizationsAPI",
+        "people": "webexteamssdk.api.people:PeopleAPI",
+        "roles": "webexteamssdk.api.roles:RolesAPI",
+        "rooms": "webexteamssdk.api.rooms:RoomsAPI",
+        "teams": "webexteamssdk.api.teams:TeamsAPI",
+        "team_memberships":
+            "webexteamssdk.api.team_memberships:TeamMembershipsAPI",
+        "webhooks": "webexteamssdk.api.webhooks:WebhooksAPI",
+    }
+
+    # Each API wrapper is stored in its own slot.  A __dict__ is kept for
+    # the instance `access_tokens` attribute (which shadows the class
+    # attribute of the same name) and for attributes added by subclasses, and
+    # a __weakref__ slot so that objects can still be weakly referenced.
+    __slots__ = (
+        "__dict__", "__weakref__", "_session", "_object_factory",
+    ) + tuple(_API_MAP)
+
+    # (name, acceptable types, optional) for the __init__ arguments that are
+    # type checked when a new WebexTeamsAPI object is created.
+    _INIT_SCHEMA = (
+        ("access_token", basestring, True),
+        ("base_url", basestring, True),
+        ("single_request_timeout", int, True),
+        ("wait_on_rate_limit", bool, True),
+        ("client_id", basestring, True),
+        ("client_secret", basestring, True),
+        ("oauth_code", basestring, True),
+        ("redirect_uri", basestring, True),
+        ("proxies", dict, True),
+        ("be_geo_id", basestring, True),
+        ("caller", basestring, True),
+        ("shared_connection_pool", bool, False),
+        ("retry_policy", RetryPolicy, True),
+        ("rate_limit_rpm", int, True),
+        ("max_concurrency", int, True),
+        ("min_interval_s", (int, float), True),
+        ("session_kwargs", dict, True),
+        ("adapter_kwargs", dict, True),
+        ("idempotency_keys", bool, False),
+        ("admission_controller", AdmissionController, True),
+    )
+
+    # Transport adapter (connection pool) shared by WebexTeamsAPI objects
+    # created with shared_connection_pool=True.
+    _shared_adapter = None
+
     def __init__(self, access_token=None, base_url=DEFAULT_BASE_URL,
                  single_request_timeout=DEFAULT_SINGLE_REQUEST_TIMEOUT,
                  wait_on_rate_limit=DEFAULT_WAIT_ON_RATE_LIMIT,
@@ -72,7 +153,16 @@ class WebexTeamsAPI(object):
                  redirect_uri=None,
                  proxies=None,
                  be_geo_id=None,
-                 caller=None):
+                 caller=None,
+                 shared_connection_pool=False,
+                 retry_policy=None,
+                 rate_limit_rpm=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 min_interval_s=None,
+                 session_kwargs=None,
+                 adapter_kwargs=None,
+                 idempotency_keys=False,
+                 admission_controller=None):
         """Create a new WebexTeamsAPI object.
 
         An access token must be used when interacting with the Webex Teams API.
@@ -122,27 +212,58 @@ class WebexTeamsAPI(object):
             caller(basestring): Optional  identifier for API usage tracking.
                 Defaults to checking for a WEBEX_PYTHON_SDK_CALLER environment
                 variable.
+            shared_connection_pool(bool): Use the connection pool shared by
+                all WebexTeamsAPI objects, instead of a pool private to this
+                object, so that keep-alive connections are reused across
+                objects.  See `configure_shared_connection_pool()`.
+            retry_policy(RetryPolicy): The policy that decides whether, and
+                after how long, failed requests are retried.  Defaults to a
+                webexteamssdk.RetryAfterBackoffPolicy.
+            rate_limit_rpm(int): Optional client-side limit on the number of
+                requests sent per minute.  Requests are delayed, rather than
+                rejected by Webex Teams, once the limit is reached.
+            max_concurrency(int): The maximum number of requests that may be
+                in flight at the same time; None for no limit.  Defaults to
+                webexteamssdk.config.DEFAULT_MAX_CONCURRENCY.
+            min_interval_s(int, float): Optional minimum time (in seconds)
+                between the start of consecutive requests.
+            session_kwargs(dict): Optional attributes to be set on the
+                underlying requests session; for example, `verify`, `cert` or
+                `trust_env`.
+            adapter_kwargs(dict): Optional keyword arguments for the
+                requests.adapters.HTTPAdapter (connection pool) used by this
+                object; for example, `pool_maxsize` or `pool_block`.
+                `pool_maxsize` defaults to `max_concurrency`, when that is
+                larger than the requests default of 10.  May not be combined
+                with `shared_connection_pool`.
+            idempotency_keys(bool): Send write (POST and PUT) requests with a
+                unique `Idempotency-Key` header, which is reused when the
+                request is retried.  Requests carrying the header may be
+                retried after a transient server error.
+            admission_controller(AdmissionController): Optional controller
+                that adapts the number of concurrent requests, made through
+                all of this object's APIs, to the observed latency and error
+                responses.
 
         Returns:
             WebexTeamsAPI: A new WebexTeamsAPI object.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If `session_kwargs` contains an unknown attribute, or
+                if `adapter_kwargs` is combined with `shared_connection_pool`.
             AccessTokenError: If an access token is not provided via the
                 access_token argument or an environment variable.
 
         """
-        check_type(access_token, basestring, optional=True)
-        check_type(base_url, basestring, optional=True)
-        check_type(single_request_timeout, int, optional=True)
-        check_type(wait_on_rate_limit, bool, optional=True)
-        check_type(client_id, basestring, optional=True)
-        check_type(client_secret, basestring, optional=True)
-        check_type(oauth_code, basestring, optional=True)
-        check_type(redirect_uri, basestring, optional=True)
-        check_type(proxies, dict, optional=True)
-        check_type(be_geo_id, basestring, optional=True)
-        check_type(caller, basestring, optional=True)
+        arguments = locals()
+        for name, acceptable_types, optional in self._INIT_SCHEMA:
+            value = arguments[name]
+            if value is None and optional:
+                continue
+            if not isinstance(value, acceptable_types):
+                # Raises a TypeError with a descriptive message
+                check_type(value, acceptable_types, optional=optional)
 
         access_token = access_token or WEBEX_TEAMS_ACCESS_TOKEN
 
@@ -153,22 +274,19 @@ class WebexTeamsAPI(object):
         )
 
         # Check if the user has provided the required oauth parameters
-        oauth_param_list = [client_id, client_secret, oauth_code, redirect_uri]
-        if not access_token and all(oauth_param_list):
-            access_token = self.access_tokens.get(
-                client_id=client_id,
-                client_secret=client_secret,
-                code=oauth_code,
-                redirect_uri=redirect_uri
-            ).access_token
+        oauth_exchange = bool(
+            not access_token and client_id and client_secret and oauth_code
+            and redirect_uri
+        )
 
         # Set optional API metrics tracking variables from env vars if there
         be_geo_id = be_geo_id or os.environ.get('BE_GEO_ID')
         caller = caller or os.environ.get('WEBEX_PYTHON_SDK_CALLER')
 
-        # If an access token hasn't been provided as a parameter, environment
-        # variable, or obtained via an OAuth exchange raise an error.
-        if not access_token:
+        # If an access token hasn't been provided as a parameter or
+        # environment variable, and can't be obtained via an OAuth exchange,
+        # raise an error.
+        if not access_token and not oauth_exchange:
             raise AccessTokenError(
                 "You must provide a Webex Teams access token to interact with "
                 "the Webex Teams APIs, either via a WEBEX_TEAMS_ACCESS_TOKEN "
@@ -180,36 +298,93 @@ class WebexTeamsAPI(object):
         # leverage a single RESTful 'session' connecting to the Webex Teams
         # cloud.
         self._session = RestSession(
-            access_token=access_token,
+            access_token=access_token or "",
             base_url=base_url,
             single_request_timeout=single_request_timeout,
             wait_on_rate_limit=wait_on_rate_limit,
             proxies=proxies,
             be_geo_id=be_geo_id,
-            caller=caller
+            caller=caller,
+            adapter=self._get_shared_adapter()
+            if shared_connection_pool else None,
+            retry_policy=retry_policy,
+            rate_limiter=SlidingWindowLimiter(rate_limit_rpm)
+            if rate_limit_rpm is not None else None,
+            max_concurrency=max_concurrency,
+            min_interval_s=min_interval_s,
+            session_kwargs=session_kwargs,
+            adapter_kwargs=adapter_kwargs,
+            idempotency_keys=idempotency_keys,
+            admission_controller=admission_controller,
         )
 
-        # API wrappers
-        self.admin_audit_events = AdminAuditEventsAPI(
-            self._session, object_factory,
-        )
-        self.attachment_actions = AttachmentActionsAPI(
-            self._session, object_factory,
-        )
-        self.events = EventsAPI(self._session, object_factory)
-        self.guest_issuer = GuestIssuerAPI(self._session, object_factory)
-        self.licenses = LicensesAPI(self._session, object_factory)
-        self.memberships = MembershipsAPI(self._session, object_factory)
-        self.messages = MessagesAPI(self._session, object_factory)
-        self.organizations = OrganizationsAPI(self._session, object_factory)
-        self.people = PeopleAPI(self._session, object_factory)
-        self.roles = RolesAPI(self._session, object_factory)
-        self.rooms = RoomsAPI(self._session, object_factory)
-        self.teams = TeamsAPI(self._session, object_factory)
-        self.team_memberships = TeamMembershipsAPI(
-            self._session, object_factory,
-        )
-        self.webhooks = WebhooksAPI(self._session, object_factory)
+        if oauth_exchange:
+            # Warm up the session's connection while the OAuth code is
+            # exchanged for an access token.
+            warm_up = threading.Thread(target=self._session.warm_up)
+            warm_up.daemon = True
+            warm_up.start()
+            try:
+                token_obj = self.access_tokens.get(
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    code=oauth_code,
+                    redirect_uri=redirect_uri
+                )
+            finally:
+                warm_up.join()
+
+            # Set the token once the warm-up thread is done with the session
+            self._session.access_token = token_obj.access_token
+
+        # API wrappers are created on first access; see __getattr__
+        self._object_factory = object_factory
+
+    def __getattr__(self, name):
+        """Create, cache and return the API wrapper for `name`.
+
+        Only called when normal attribute lookup fails; after the first access
+        the wrapper is found in its slot.
+        """
+        import_path = type(self)._API_MAP.get(name)
+        if import_path is None:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(
+                    type(self).__name__, name,
+                )
+            )
+
+        api_class = _import_class(import_path)
+        api = api_class(self._session, self._object_factory)
+        setattr(self, name, api)
+        return api
+
+    def __dir__(self):
+        """Include the lazily-created API wrappers in dir() listings."""
+        return sorted(set(dir(type(self)) + list(self.__dict__)
+                          + list(self._API_MAP)))
+
+    def __enter__(self):
+        """Open a connection to the Webex Teams cloud ahead of the first call.
+
+        Using a WebexTeamsAPI object as a context manager warms up its
+        connection on entry (see `RestSession.warm_up()`) and closes its
+        connections on exit.
+        """
+        self._session.warm_up()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the connections opened by this WebexTeamsAPI object."""
+        self.close()
+
+    def close(self):
+        """Close the connections opened by this WebexTeamsAPI object.
+
+        Connections in the shared connection pool are left open; see
+        `close_shared_connection_pool()`.
+        """
+        self._session.close()
 
     @property
     def access_token(self):
@@ -231,6 +406,16 @@ class WebexTeamsAPI(object):
         """Automatic rate-limit handling enabled / disabled."""
         return self._session.wait_on_rate_limit
 
+    @property
+    def max_concurrency(self):
+        """The maximum number of simultaneous in-flight requests."""
+        return self._session.max_concurrency
+
+    @property
+    def retry_policy(self):
+        """The policy used to retry failed requests."""
+        return self._session.retry_policy
+
     # Create a class attribute for the Access Tokens API that can be accessed
     # before WebexTeamsAPI object is initialized.
     access_tokens = AccessTokensAPI(
@@ -239,6 +424,79 @@ class WebexTeamsAPI(object):
         single_request_timeout=DEFAULT_SINGLE_REQUEST_TIMEOUT,
     )
 
+    @classmethod
+    def configure_shared_connection_pool(cls, pool_connections=10,
+                                         pool_maxsize=10):
+        """Configure the connection pool shared by WebexTeamsAPI objects.
+
+        WebexTeamsAPI objects created with `shared_connection_pool=True` share
+        a single pool of keep-alive connections, which avoids repeating the
+        TCP and TLS handshakes for applications that create many short-lived
+        WebexTeamsAPI objects.  Calling this method replaces the current
+        shared pool; objects that are already using it are unaffected.
+
+        Args:
+            pool_connections(int): The number of host connection pools to
+                cache.
+            pool_maxsize(int): The maximum number of connections to keep in
+                each host connection pool.
+
+        Returns:
+            requests.adapters.HTTPAdapter: The new shared transport adapter.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+        """
+        check_type(pool_connections, int)
+        check_type(pool_maxsize, int)
+
+        cls._shared_adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        return cls._shared_adapter
+
+    @classmethod
+    def close_shared_connection_pool(cls):
+        """Close the connections in the shared connection pool."""
+        if cls._shared_adapter is not None:
+            cls._shared_adapter.close()
+            cls._shared_adapter = None
+
+    @classmethod
+    def _get_shared_adapter(cls):
+        """Return the shared transport adapter; creating it if needed."""
+        with _shared_adapter_lock:
+            if cls._shared_adapter is None:
+                cls.configure_shared_connection_pool()
+            return cls._shared_adapter
+
+    @classmethod
+    def create(cls, *args, **kwargs):
+        """Create a new WebexTeamsAPI object with a ready-to-use connection.
+
+        Creating a WebexTeamsAPI object directly defers opening the HTTP
+        session until the first API call is made.  This factory method
+        creates the object and then warms up its connection (see
+        `RestSession.warm_up()`), so that the connection setup happens now,
+        off the critical path of the first API call.
+
+        Args:
+            *args: Passed on to WebexTeamsAPI.
+            **kwargs: Passed on to WebexTeamsAPI.
+
+        Returns:
+            WebexTeamsAPI: A new WebexTeamsAPI object.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            AccessTokenError: If an access token is not provided via the
+                access_token argument or an environment variable.
+        """
+        api = cls(*args, **kwargs)
+        api._session.warm_up()
+        return api
+
     @classmethod
     def from_oauth_code(cls, client_id, client_secret, code, redirect_uri):
         """Create a new WebexTeamsAPI connection object using an OAuth code.
@@ -293,3 +551,12 @@ class WebexTeamsAPI(object):
         token_obj = cls.access_tokens.refresh(client_id, client_secret,
                                               refresh_token)
         return cls(access_token=token_obj.access_token)
+
+
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ (PEP 562) is not supported; import the API
+    # wrapper classes up front so they remain importable from this package.
+    for _import_path in WebexTeamsAPI._API_MAP.values():
+        _api_class = _import_class(_import_path)
+        globals()[_api_class.__name__] = _api_class
+    del _import_path, _api_class
@@ -30,6 +30,8 @@ DEFAULT_SINGLE_REQUEST_TIMEOUT = 60
 
 DEFAULT_WAIT_ON_RATE_LIMIT = True
 
+DEFAULT_MAX_CONCURRENCY = 16
+
 ACCESS_TOKEN_ENVIRONMENT_VARIABLE = "WEBEX_TEAMS_ACCESS_TOKEN"
 
 LEGACY_ACCESS_TOKEN_ENVIRONMENT_VARIABLES = [
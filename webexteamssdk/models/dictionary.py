@@ -44,7 +44,8 @@ def dict_data_factory(model, json_data):
 
     Returns:
         OrderedDict: An ordered dictionary with the contents of the Webex Teams
-         JSON object.
+         JSON object; an (insertion ordered) dict when the optional `orjson`
+         package is installed.
 
     Raises:
         TypeError: If the json_data parameter is not a JSON string or
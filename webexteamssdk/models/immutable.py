@@ -63,7 +63,16 @@ from .mixins.webhook_event import WebhookEventBasicPropertiesMixin
 
 
 class ImmutableData(object):
-    """Model a Webex Teams JSON object as an immutable native Python object."""
+    """Model a Webex Teams JSON object as an immutable native Python object.
+
+    The JSON data is wrapped, not copied; attribute values are looked up in
+    the JSON data when they are accessed.
+    """
+
+    # Avoid a per-object __dict__; data objects are created for every item
+    # returned by the Webex Teams APIs.  Data objects can't be given new
+    # attributes, but can still be weakly referenced and pickled.
+    __slots__ = ("_json_data", "__weakref__")
 
     def __init__(self, json_data):
         """Init a new ImmutableData object from a dictionary or JSON string.
@@ -98,7 +107,11 @@ class ImmutableData(object):
                 requested.
 
         """
-        if item in list(self._json_data.keys()):
+        if item == "_json_data":
+            # Not yet initialized (for example, while being unpickled)
+            raise AttributeError(item)
+
+        if item in self._json_data:
             item_data = self._json_data[item]
             if isinstance(item_data, dict):
                 return ImmutableData(item_data)
@@ -110,6 +123,14 @@ class ImmutableData(object):
                 "".format(self.__class__.__name__, item)
             )
 
+    def __getstate__(self):
+        """Return the JSON data as the pickled state of this object."""
+        return self._json_data
+
+    def __setstate__(self, state):
+        """Restore this object from its pickled JSON data."""
+        self._json_data = state
+
     def __str__(self):
         """A human-readable string representation of this object."""
         class_str = self.__class__.__name__
@@ -160,7 +181,11 @@ class ImmutableData(object):
 
     @property
     def json_data(self):
-        """A copy of the data object's JSON data (OrderedDict)."""
+        """A copy of the data object's JSON data.
+
+        JSON objects are parsed as OrderedDicts, or as (insertion ordered)
+        dicts when the optional `orjson` package is installed.
+        """
         # TODO: When we move to Python v3+ only; use MappingProxyType.
         return self._json_data.copy()
 
@@ -181,15 +206,21 @@ class ImmutableData(object):
 class AccessToken(ImmutableData, AccessTokenBasicPropertiesMixin):
     """Webex Teams Access-Token data model."""
 
+    __slots__ = ()
+
 
 class AdminAuditEventData(ImmutableData,
                           AdminAuditEventDataBasicPropertiesMixin):
     """Webex Teams Admin Audit Event Data object data model."""
 
+    __slots__ = ()
+
 
 class AdminAuditEvent(ImmutableData, AdminAuditEventBasicPropertiesMixin):
     """Webex Teams Admin Audit Event data model."""
 
+    __slots__ = ()
+
     @property
     def data(self):
         """The event resource data."""
@@ -199,10 +230,14 @@ class AdminAuditEvent(ImmutableData, AdminAuditEventBasicPropertiesMixin):
 class AttachmentAction(ImmutableData, AttachmentActionBasicPropertiesMixin):
     """Webex Attachment Actions data model"""
 
+    __slots__ = ()
+
 
 class Event(ImmutableData, EventBasicPropertiesMixin):
     """Webex Teams Event data model."""
 
+    __slots__ = ()
+
     @property
     def data(self):
         """The event’s data representation.
@@ -216,50 +251,74 @@ class Event(ImmutableData, EventBasicPropertiesMixin):
 class License(ImmutableData, LicenseBasicPropertiesMixin):
     """Webex Teams License data model."""
 
+    __slots__ = ()
+
 
 class Membership(ImmutableData, MembershipBasicPropertiesMixin):
     """Webex Teams Membership data model."""
 
+    __slots__ = ()
+
 
 class Message(ImmutableData, MessageBasicPropertiesMixin):
     """Webex Teams Message data model."""
 
+    __slots__ = ()
+
 
 class Organization(ImmutableData, OrganizationBasicPropertiesMixin):
     """Webex Teams Organization data model."""
 
+    __slots__ = ()
+
 
 class Person(ImmutableData, PersonBasicPropertiesMixin):
     """Webex Teams Person data model."""
 
+    __slots__ = ()
+
 
 class Role(ImmutableData, RoleBasicPropertiesMixin):
     """Webex Teams Role data model."""
 
+    __slots__ = ()
+
 
 class Room(ImmutableData, RoomBasicPropertiesMixin):
     """Webex Teams Room data model."""
 
+    __slots__ = ()
+
 
 class RoomMeetingInfo(ImmutableData, RoomMeetingInfoBasicPropertiesMixin):
     """Webex Teams Room Meeting Info data model."""
 
+    __slots__ = ()
+
 
 class Team(ImmutableData, TeamBasicPropertiesMixin):
     """Webex Teams Team data model."""
 
+    __slots__ = ()
+
 
 class TeamMembership(ImmutableData, TeamMembershipBasicPropertiesMixin):
     """Webex Teams Team-Membership data model."""
 
+    __slots__ = ()
+
 
 class Webhook(ImmutableData, WebhookBasicPropertiesMixin):
     """Webex Teams Webhook data model."""
 
+    __slots__ = ()
+
 
 class WebhookEvent(ImmutableData, WebhookEventBasicPropertiesMixin):
     """Webex Teams Webhook-Events data model."""
 
+    __slots__ = ()
+
     @property
     def data(self):
         """The event resource data."""
@@ -269,6 +328,8 @@ class WebhookEvent(ImmutableData, WebhookEventBasicPropertiesMixin):
 class GuestIssuerToken(ImmutableData, GuestIssuerTokenBasicPropertiesMixin):
     """Webex Teams Guest Issuer Token data model"""
 
+    __slots__ = ()
+
 
 immutable_data_models = defaultdict(
     lambda: ImmutableData,
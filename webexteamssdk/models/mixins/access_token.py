@@ -36,6 +36,8 @@ from builtins import *
 class AccessTokenBasicPropertiesMixin(object):
     """Access Token basic properties."""
 
+    __slots__ = ()
+
     @property
     def access_token(self):
         """Webex Teams access token."""
@@ -38,6 +38,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class AdminAuditEventDataBasicPropertiesMixin(object):
     """Admin Audit Event Data basic properties."""
 
+    __slots__ = ()
+
     @property
     def actorOrgName(self):
         """The display name of the organization."""
@@ -117,6 +119,8 @@ class AdminAuditEventDataBasicPropertiesMixin(object):
 class AdminAuditEventBasicPropertiesMixin(object):
     """Admin Audit Event basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the event."""
@@ -38,6 +38,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class EventBasicPropertiesMixin(object):
     """Event basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """The unique identifier for the event."""
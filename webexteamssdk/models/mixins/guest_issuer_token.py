@@ -35,6 +35,8 @@ from builtins import *
 class GuestIssuerTokenBasicPropertiesMixin(object):
     """Guest issuer token basic properties"""
 
+    __slots__ = ()
+
     @property
     def token(self):
         return self._json_data.get("token")
@@ -36,6 +36,8 @@ from builtins import *
 class LicenseBasicPropertiesMixin(object):
     """License basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the license."""
@@ -40,6 +40,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class MembershipBasicPropertiesMixin(object):
     """Membership basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the membership."""
@@ -38,6 +38,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class MessageBasicPropertiesMixin(object):
     """Message basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """The unique identifier for the message."""
@@ -38,6 +38,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class PersonBasicPropertiesMixin(object):
     """Person basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the person."""
@@ -36,6 +36,8 @@ from builtins import *
 class RoomMeetingInfoBasicPropertiesMixin(object):
     """Room basic properties."""
 
+    __slots__ = ()
+
     @property
     def roomId(self):
         """A unique identifier for the room."""
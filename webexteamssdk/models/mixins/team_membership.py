@@ -38,6 +38,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class TeamMembershipBasicPropertiesMixin(object):
     """Team Membership basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the team membership."""
@@ -38,6 +38,8 @@ from webexteamssdk.utils import WebexTeamsDateTime
 class WebhookBasicPropertiesMixin(object):
     """Webhook basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the webhook."""
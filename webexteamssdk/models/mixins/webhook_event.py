@@ -36,6 +36,8 @@ from builtins import *
 class WebhookEventBasicPropertiesMixin(object):
     """Webhook Event basic properties."""
 
+    __slots__ = ()
+
     @property
     def id(self):
         """A unique identifier for the webhook."""
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Client-side rate and concurrency limiting for Webex Teams API requests.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+from collections import deque
+import threading
+import time
+
+from .response_codes import RATE_LIMIT_RESPONSE_CODE, RETRYABLE_RESPONSE_CODES
+from .retry import DEFAULT_RETRY_AFTER, parse_retry_after
+from .utils import check_type
+
+
+# Length (seconds) of the sliding window used to count requests
+WINDOW_SECONDS = 60
+
+# Pause when fewer than this fraction of the server's limit remains...
+LOW_REMAINING_FRACTION = 0.1
+
+# ...and no more than this many requests remain in the server's window
+LOW_REMAINING_COUNT = 2
+
+
+class SlidingWindowLimiter(object):
+    """Limit the number of requests sent per minute.
+
+    Tracks the send times of the requests made in the last minute, and blocks
+    new requests once `rpm` requests have been sent within the window.  The
+    limiter also pauses all requests when Webex Teams reports (via response
+    headers) that the server-side rate limit is about to be exhausted, or has
+    been exceeded.
+
+    """
+
+    def __init__(self, rpm):
+        """Initialize a new SlidingWindowLimiter.
+
+        Args:
+            rpm(int): The maximum number of requests per minute.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `rpm` is not a positive integer.
+
+        """
+        check_type(rpm, int)
+        if rpm <= 0:
+            raise ValueError("rpm must be a positive integer")
+
+        super(SlidingWindowLimiter, self).__init__()
+
+        self._rpm = rpm
+        self._request_times = deque()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rpm(self):
+        """The maximum number of requests per minute."""
+        return self._rpm
+
+    def acquire(self):
+        """Block until a request may be sent, and record its send time."""
+        while True:
+            with self._lock:
+                now = time.time()
+
+                # Drop requests that have left the window
+                while (self._request_times
+                       and now - self._request_times[0] >= WINDOW_SECONDS):
+                    self._request_times.popleft()
+
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif len(self._request_times) >= self._rpm:
+                    wait = self._request_times[0] + WINDOW_SECONDS - now
+                else:
+                    self._request_times.append(now)
+                    return
+
+            time.sleep(wait)
+
+    def pause_until(self, timestamp):
+        """Block all requests until the provided time (seconds since epoch)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, timestamp)
+
+    def update(self, response):
+        """Pause requests based on the rate-limit headers of a response.
+
+        Args:
+            response(requests.Response): A response from the Webex Teams APIs.
+
+        """
+        headers = response.headers
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        if response.status_code == RATE_LIMIT_RESPONSE_CODE:
+            if retry_after is None:
+                retry_after = DEFAULT_RETRY_AFTER
+            self.pause_until(time.time() + retry_after)
+            return
+
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            limit = int(headers.get("X-RateLimit-Limit", self._rpm))
+        except (KeyError, ValueError):
+            return
+
+        if (remaining < limit * LOW_REMAINING_FRACTION
+                and remaining <= LOW_REMAINING_COUNT):
+            if retry_after is None:
+                retry_after = WINDOW_SECONDS
+            self.pause_until(time.time() + retry_after)
+
+
+class AdmissionController(object):
+    """Adaptively limit the number of concurrent requests (AIMD).
+
+    Maintains a concurrency limit between `c_min` and `c_max`.  The limit is
+    increased by `alpha` after each response received within the
+    `latency_target_s` latency target, and multiplied by `beta` after each
+    rate-limited or server error response, or when the latency target is
+    exceeded.  Requests wait for a free slot while the number of requests in
+    flight is at the current limit.
+
+    """
+
+    def __init__(self, c_min=1, c_max=64, alpha=0.5, beta=0.5,
+                 latency_target_s=1.0, initial_concurrency=None):
+        """Initialize a new AdmissionController.
+
+        Args:
+            c_min(int): The minimum concurrency limit.
+            c_max(int): The maximum concurrency limit.
+            alpha(int, float): The additive limit increase.
+            beta(float): The multiplicative limit decrease factor (0 < beta <
+                1).
+            latency_target_s(int, float): The response latency (seconds)
+                above which the limit is decreased.
+            initial_concurrency(int): The initial concurrency limit.
+                Defaults to `c_min`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a limit or factor is out of range.
+
+        """
+        check_type(c_min, int)
+        check_type(c_max, int)
+        check_type(alpha, (int, float))
+        check_type(beta, float)
+        check_type(latency_target_s, (int, float))
+        check_type(initial_concurrency, int, optional=True)
+        if initial_concurrency is None:
+            initial_concurrency = c_min
+        if not 0 < c_min <= initial_concurrency <= c_max:
+            raise ValueError(
+                "Limits must satisfy 0 < c_min <= initial_concurrency <= c_max"
+            )
+        if not 0 < beta < 1:
+            raise ValueError("beta must be between 0 and 1")
+
+        super(AdmissionController, self).__init__()
+
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target_s = latency_target_s
+
+        self._limit = float(initial_concurrency)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        """The current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self):
+        """The number of requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self):
+        """Block until a request slot is available, and take it."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self):
+        """Return a request slot taken with acquire()."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def report(self, latency, status_code):
+        """Adjust the concurrency limit based on a response.
+
+        Args:
+            latency(float): The response latency (seconds).
+            status_code(int): The HTTP status code of the response.
+
+        """
+        congested = (
+            status_code == RATE_LIMIT_RESPONSE_CODE
+            or status_code in RETRYABLE_RESPONSE_CODES
+            or latency > self.latency_target_s
+        )
+
+        with self._condition:
+            if congested:
+                self._limit = max(self.c_min, self._limit * self.beta)
+            else:
+                self._limit = min(self.c_max, self._limit + self.alpha)
+            self._condition.notify_all()
@@ -66,6 +66,8 @@ RESPONSE_CODES = {
 
 RATE_LIMIT_RESPONSE_CODE = 429
 
+RETRYABLE_RESPONSE_CODES = (502, 503, 504)
+
 EXPECTED_RESPONSE_CODE = {
     "GET": 200,
     "POST": 200,
@@ -35,22 +35,39 @@ from builtins import *
 from future import standard_library
 standard_library.install_aliases()
 
+import contextlib
 import json
 import logging
 import platform
 import sys
+import threading
 import time
 import urllib
 import urllib.parse
+import uuid
 import warnings
 
 import requests
 from past.builtins import basestring
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ._metadata import __title__, __version__
-from .config import DEFAULT_SINGLE_REQUEST_TIMEOUT, DEFAULT_WAIT_ON_RATE_LIMIT
-from .exceptions import MalformedResponse, RateLimitError, RateLimitWarning
+from .config import (
+    DEFAULT_MAX_CONCURRENCY, DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_WAIT_ON_RATE_LIMIT,
+)
+from .exceptions import (
+    ApiError, MalformedResponse, RateLimitError, RateLimitWarning,
+)
+from .rate_limiter import AdmissionController, SlidingWindowLimiter
 from .response_codes import EXPECTED_RESPONSE_CODE
+from .retry import (
+    IDEMPOTENCY_KEY_HEADER, RetryAfterBackoffPolicy, RetryPolicy,
+)
 from .utils import (
     check_response_code, check_type, extract_and_parse_json, validate_base_url,
 )
@@ -59,6 +76,19 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+# Request methods that are sent with an idempotency key, when enabled
+IDEMPOTENCY_KEY_METHODS = ("POST", "PUT", "PATCH")
+
+# HTTP headers set on every session
+AUTHORIZATION_HEADER = "Authorization"
+CONTENT_TYPE_HEADER = "Content-type"
+JSON_CONTENT_TYPE = "application/json;charset=utf-8"
+BEARER_TOKEN_FORMAT = "Bearer {}".format
+
+# User-Agent strings already built, keyed by (be_geo_id, caller)
+_user_agent_strings = {}
+
+
 # Helper Functions
 def _fix_next_url(next_url):
     """Remove max=null parameter from URL.
@@ -103,8 +133,30 @@ def _fix_next_url(next_url):
     return urllib.parse.urlunparse(parsed_url)
 
 
+def _dumps_json(json_data):
+    """Serialize a JSON request body with orjson, if it is installed.
+
+    Returns None when orjson isn't installed or can't serialize the data, in
+    which case the body should be serialized by requests (stdlib json).
+    """
+    if orjson is None:
+        return None
+
+    try:
+        return orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return None
+
+
 def user_agent(be_geo_id=None, caller=None):
-    """Build a User-Agent HTTP header string."""
+    """Build a User-Agent HTTP header string.
+
+    The platform data doesn't change while the process runs, so the string is
+    only built once for each combination of arguments.
+    """
+    cached = _user_agent_strings.get((be_geo_id, caller))
+    if cached is not None:
+        return cached
 
     product = __title__
     version = __version__
@@ -166,6 +218,8 @@ def user_agent(be_geo_id=None, caller=None):
 
     logger.info("User-Agent: " + user_agent_string)
 
+    _user_agent_strings[(be_geo_id, caller)] = user_agent_string
+
     return user_agent_string
 
 
@@ -178,7 +232,16 @@ class RestSession(object):
                  wait_on_rate_limit=DEFAULT_WAIT_ON_RATE_LIMIT,
                  proxies=None,
                  be_geo_id=None,
-                 caller=None):
+                 caller=None,
+                 adapter=None,
+                 retry_policy=None,
+                 rate_limiter=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 min_interval_s=None,
+                 session_kwargs=None,
+                 adapter_kwargs=None,
+                 idempotency_keys=False,
+                 admission_controller=None):
         """Initialize a new RestSession object.
 
         Args:
@@ -198,9 +261,41 @@ class RestSession(object):
             caller(basestring): Optional  identifier for API usage tracking.
                 Defaults to checking for a WEBEX_PYTHON_SDK_CALLER environment
                 variable.
+            adapter(requests.adapters.HTTPAdapter): Optional transport adapter
+                to be mounted on the requests session.  Sessions that share an
+                adapter share its pool of keep-alive connections.  The adapter
+                is not closed when the session is closed.
+            retry_policy(RetryPolicy): The policy that decides whether, and
+                after how long, failed requests are retried.  Defaults to a
+                RetryAfterBackoffPolicy.
+            rate_limiter(SlidingWindowLimiter): Optional client-side rate
+                limiter that paces the requests sent by this session.
+            max_concurrency(int): The maximum number of requests this session
+                may have in flight at the same time; None for no limit.
+            min_interval_s(int, float): Optional minimum time (in seconds)
+                between the start of consecutive requests.
+            session_kwargs(dict): Optional attributes to be set on the
+                requests session; for example, `verify`, `cert` or
+                `trust_env`.
+            adapter_kwargs(dict): Optional keyword arguments used to create
+                the transport adapter (connection pool) mounted on the
+                requests session; for example, `pool_maxsize` or
+                `pool_block`.  `pool_maxsize` defaults to `max_concurrency`,
+                when that is larger than the requests default of 10.  May not
+                be combined with `adapter`.
+            idempotency_keys(bool): Send write requests with a unique
+                `Idempotency-Key` header, which is reused when the request is
+                retried.  Requests carrying the header may be retried after a
+                server error.
+            admission_controller(AdmissionController): Optional controller
+                that adapts the number of concurrent requests to the observed
+                latency and error responses.  May be shared by several
+                sessions.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If `session_kwargs` contains an unknown attribute, or
+                if both `adapter` and `adapter_kwargs` are provided.
 
         """
         check_type(access_token, basestring)
@@ -208,6 +303,28 @@ class RestSession(object):
         check_type(single_request_timeout, int, optional=True)
         check_type(wait_on_rate_limit, bool)
         check_type(proxies, dict, optional=True)
+        check_type(adapter, requests.adapters.HTTPAdapter, optional=True)
+        check_type(retry_policy, RetryPolicy, optional=True)
+        check_type(rate_limiter, SlidingWindowLimiter, optional=True)
+        check_type(max_concurrency, int, optional=True)
+        check_type(min_interval_s, (int, float), optional=True)
+        check_type(session_kwargs, dict, optional=True)
+        check_type(adapter_kwargs, dict, optional=True)
+        check_type(idempotency_keys, bool)
+        check_type(admission_controller, AdmissionController, optional=True)
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        if session_kwargs:
+            unknown = set(session_kwargs) - set(requests.Session.__attrs__)
+            if unknown:
+                raise ValueError(
+                    "Unknown requests session attribute(s): {}"
+                    "".format(", ".join(sorted(unknown)))
+                )
+        if adapter is not None and adapter_kwargs:
+            raise ValueError(
+                "adapter and adapter_kwargs may not be used together"
+            )
 
         super(RestSession, self).__init__()
 
@@ -216,19 +333,78 @@ class RestSession(object):
         self._access_token = str(access_token)
         self._single_request_timeout = single_request_timeout
         self._wait_on_rate_limit = wait_on_rate_limit
+        self._retry_policy = retry_policy or RetryAfterBackoffPolicy()
+        self._rate_limiter = rate_limiter
+
+        # Bound the number and spacing of in-flight requests
+        self._max_concurrency = max_concurrency
+        self._concurrency_semaphore = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency else None
+        )
+        self._min_interval_s = min_interval_s
+        self._next_request_time = 0.0
+        self._interval_lock = threading.Lock()
+
+        # The requests session is created on first use; see _req_session
+        self._requests_session = None
+        self._requests_session_lock = threading.Lock()
+        self._proxies = proxies
+        self._be_geo_id = be_geo_id
+        self._caller = caller
+        self._adapter = adapter
+        self._session_kwargs = session_kwargs
+        self._adapter_kwargs = adapter_kwargs
+        self._idempotency_keys = idempotency_keys
+        self._admission_controller = admission_controller
+
+        # HTTP headers to be applied to the session
+        self._headers = {
+            AUTHORIZATION_HEADER: BEARER_TOKEN_FORMAT(access_token),
+            CONTENT_TYPE_HEADER: JSON_CONTENT_TYPE,
+        }
 
-        # Initialize a new session
-        self._req_session = requests.session()
-
-        if proxies is not None:
-            self._req_session.proxies.update(proxies)
-
-        # Update the HTTP headers for the session
-        self.update_headers({
-            "Authorization": "Bearer " + access_token,
-            "Content-type": "application/json;charset=utf-8",
-            "User-Agent": user_agent(be_geo_id=be_geo_id, caller=caller),
-        })
+    @property
+    def _req_session(self):
+        """The underlying requests session; created on first access."""
+        if self._requests_session is None:
+            with self._requests_session_lock:
+                if self._requests_session is None:
+                    req_session = requests.session()
+
+                    if self._proxies is not None:
+                        req_session.proxies.update(self._proxies)
+
+                    for name, value in (self._session_kwargs or {}).items():
+                        setattr(req_session, name, value)
+
+                    if self._adapter is not None:
+                        adapter = self._adapter
+                    else:
+                        # Pool (at least) a connection for each request that
+                        # may be in flight, so none are discarded
+                        adapter_kwargs = {
+                            "pool_maxsize": max(
+                                self._max_concurrency or 0,
+                                requests.adapters.DEFAULT_POOLSIZE,
+                            ),
+                        }
+                        adapter_kwargs.update(self._adapter_kwargs or {})
+                        adapter = requests.adapters.HTTPAdapter(
+                            **adapter_kwargs
+                        )
+
+                    req_session.mount("https://", adapter)
+                    req_session.mount("http://", adapter)
+
+                    req_session.headers["User-Agent"] = user_agent(
+                        be_geo_id=self._be_geo_id, caller=self._caller,
+                    )
+                    req_session.headers.update(self._headers)
+
+                    self._requests_session = req_session
+
+        return self._requests_session
 
     @property
     def base_url(self):
@@ -240,6 +416,13 @@ class RestSession(object):
         """The Webex Teams access token used for this session."""
         return self._access_token
 
+    @access_token.setter
+    def access_token(self, value):
+        """Set the Webex Teams access token used for this session."""
+        check_type(value, basestring)
+        self._access_token = str(value)
+        self.update_headers({AUTHORIZATION_HEADER: BEARER_TOKEN_FORMAT(value)})
+
     @property
     def single_request_timeout(self):
         """The timeout (seconds) for a single HTTP REST API request."""
@@ -271,9 +454,70 @@ class RestSession(object):
         check_type(value, bool)
         self._wait_on_rate_limit = value
 
+    @property
+    def retry_policy(self):
+        """The policy used to retry failed requests."""
+        return self._retry_policy
+
+    @property
+    def rate_limiter(self):
+        """The client-side rate limiter used by this session (or None)."""
+        return self._rate_limiter
+
+    @property
+    def max_concurrency(self):
+        """The maximum number of simultaneous in-flight requests."""
+        return self._max_concurrency
+
+    @contextlib.contextmanager
+    def _request_slot(self):
+        """Hold one of the session's concurrent request slots.
+
+        Blocks until the admission controller (if any) admits the request,
+        fewer than `max_concurrency` requests are in flight, and at least
+        `min_interval_s` seconds have passed since the previous request was
+        started.
+        """
+        if self._admission_controller is not None:
+            self._admission_controller.acquire()
+        if self._concurrency_semaphore is not None:
+            self._concurrency_semaphore.acquire()
+        try:
+            if self._min_interval_s:
+                with self._interval_lock:
+                    now = time.time()
+                    request_time = max(now, self._next_request_time)
+                    self._next_request_time = (
+                        request_time + self._min_interval_s
+                    )
+                if request_time > now:
+                    time.sleep(request_time - now)
+            yield
+        finally:
+            if self._concurrency_semaphore is not None:
+                self._concurrency_semaphore.release()
+            if self._admission_controller is not None:
+                self._admission_controller.release()
+
     @property
     def headers(self):
         """The HTTP headers used for requests in this session."""
+        if self._requests_session is None:
+            # Don't create the underlying session just to report its headers;
+            # build the headers it will be created with
+            session_kwargs = self._session_kwargs or {}
+            if "headers" in session_kwargs:
+                headers = requests.structures.CaseInsensitiveDict(
+                    session_kwargs["headers"]
+                )
+            else:
+                headers = requests.utils.default_headers()
+            headers["User-Agent"] = user_agent(
+                be_geo_id=self._be_geo_id, caller=self._caller,
+            )
+            headers.update(self._headers)
+            return headers
+
         return self._req_session.headers.copy()
 
     def update_headers(self, headers):
@@ -289,7 +533,45 @@ class RestSession(object):
 
         """
         check_type(headers, dict)
-        self._req_session.headers.update(headers)
+        # Hold the session lock so that a session being created concurrently
+        # can't miss the update
+        with self._requests_session_lock:
+            self._headers.update(headers)
+            if self._requests_session is not None:
+                self._requests_session.headers.update(headers)
+
+    def warm_up(self):
+        """Open a keep-alive connection to the API host.
+
+        Sends a HEAD request to the base URL, so that the DNS lookup and the
+        TCP and TLS handshakes are completed before the first API request is
+        made.  The response, and any connection errors, are ignored.
+
+        """
+        try:
+            # The access token isn't needed, and may not yet be available
+            self._req_session.head(
+                self.base_url,
+                headers={AUTHORIZATION_HEADER: None},
+                allow_redirects=False,
+                timeout=self.single_request_timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection warm-up failed: %s", e)
+
+    def close(self):
+        """Close the connections opened by this session.
+
+        A transport adapter provided when the session was created (such as
+        a shared connection pool) is left open.
+
+        """
+        if self._requests_session is None:
+            return
+
+        for adapter in self._requests_session.adapters.values():
+            if adapter is not self._adapter:
+                adapter.close()
 
     def abs_url(self, url):
         """Given a relative or absolute URL; return an absolute URL.
@@ -314,9 +596,16 @@ class RestSession(object):
 
         This base method:
             * Expands the API endpoint URL to an absolute URL
+            * Adds an idempotency key to write requests, when enabled
+            * Waits for the client-side rate limiter (if any), the retry
+              policy's pacing, the admission controller (if any), a
+              concurrency slot and the minimum request interval
             * Makes the actual HTTP request to the API endpoint
-            * Provides support for Webex Teams rate-limiting
+            * Reports the response and its latency to the retry policy,
+              admission controller and rate limiter
             * Inspects response codes and raises exceptions as appropriate
+            * Retries rate-limited requests (when `wait_on_rate_limit` is
+              enabled) and transient failures as directed by the retry policy
 
         Args:
             method(basestring): The request-method type ("GET", "POST", etc.).
@@ -327,7 +616,11 @@ class RestSession(object):
 
         Raises:
             ApiError: If anything other than the expected response code is
-                returned by the Webex Teams API endpoint.
+                returned by the Webex Teams API endpoint, and the request
+                isn't retried.
+            RateLimitError: If the request is rate-limited and isn't retried.
+            requests.exceptions.RequestException: If the request fails, and
+                isn't retried.
 
         """
         # Ensure the url is an absolute URL
@@ -336,26 +629,83 @@ class RestSession(object):
         # Update request kwargs with session defaults
         kwargs.setdefault("timeout", self.single_request_timeout)
 
+        # Use the same idempotency key for all attempts of a write request
+        if self._idempotency_keys and method in IDEMPOTENCY_KEY_METHODS:
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault(IDEMPOTENCY_KEY_HEADER, uuid.uuid4().hex)
+            kwargs["headers"] = headers
+
+        # Rate-limit waits are counted separately, so that they don't use up
+        # the retries (or grow the backoff) for transient failures
+        retries = 0
+        rate_limit_retries = 0
         while True:
             # Make the HTTP request to the API endpoint
-            response = self._req_session.request(method, abs_url, **kwargs)
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            self._retry_policy.before_request()
+            try:
+                with self._request_slot():
+                    start_time = time.time()
+                    response = self._req_session.request(
+                        method, abs_url, **kwargs
+                    )
+            except requests.exceptions.RequestException as e:
+                # Retry transient network failures if the policy allows it
+                retry_delay = self._retry_policy.get_exception_retry_delay(
+                    e, retries,
+                )
+                if retry_delay is None:
+                    raise
+                logger.warning(
+                    "%s %s failed (%s); retrying in %.1f seconds",
+                    method, abs_url, e, retry_delay,
+                )
+                time.sleep(retry_delay)
+                retries += 1
+                continue
+
+            latency = time.time() - start_time
+            self._retry_policy.after_response(response, latency)
+            if self._admission_controller is not None:
+                self._admission_controller.report(
+                    latency, response.status_code,
+                )
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response)
 
             try:
                 # Check the response code for error conditions
                 check_response_code(response, erc)
-            except RateLimitError as e:
+            except RateLimitError:
                 # Catch rate-limit errors
                 # Wait and retry if automatic rate-limit handling is enabled
-                if self.wait_on_rate_limit:
-                    warnings.warn(RateLimitWarning(response))
-                    time.sleep(e.retry_after)
-                    continue
-                else:
-                    # Re-raise the RateLimitError
+                if not self.wait_on_rate_limit:
                     raise
+                retry_delay = self._retry_policy.get_retry_delay(
+                    response, rate_limit_retries,
+                )
+                if retry_delay is None:
+                    raise
+                warnings.warn(RateLimitWarning(response))
+                rate_limit_retries += 1
+            except ApiError:
+                # Retry other errors if the retry policy allows it
+                retry_delay = self._retry_policy.get_retry_delay(
+                    response, retries,
+                )
+                if retry_delay is None:
+                    raise
+                logger.warning(
+                    "%s %s returned %s; retrying in %.1f seconds",
+                    method, abs_url, response.status_code, retry_delay,
+                )
+                retries += 1
             else:
                 return response
 
+            time.sleep(retry_delay)
+
     def get(self, url, params=None, **kwargs):
         """Sends a GET request.
 
@@ -484,6 +834,12 @@ class RestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["POST"])
 
+        if json is not None and data is None:
+            # Serialize the JSON body with the faster orjson package
+            data = _dumps_json(json)
+            if data is not None:
+                json = None
+
         response = self.request("POST", url, erc, json=json, data=data,
                                 **kwargs)
         return extract_and_parse_json(response)
@@ -509,6 +865,12 @@ class RestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["PUT"])
 
+        if json is not None and data is None:
+            # Serialize the JSON body with the faster orjson package
+            data = _dumps_json(json)
+            if data is not None:
+                json = None
+
         response = self.request("PUT", url, erc, json=json, data=data,
                                 **kwargs)
         return extract_and_parse_json(response)
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""Retry policies for requests sent to the Webex Teams APIs.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import email.utils
+import random
+import threading
+import time
+
+import requests
+
+from .response_codes import RATE_LIMIT_RESPONSE_CODE, RETRYABLE_RESPONSE_CODES
+from .utils import check_type
+
+
+# Seconds to wait on a rate-limit response without a `Retry-After` header
+DEFAULT_RETRY_AFTER = 15
+
+# Request methods that may be safely retried after a server error
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+# Header identifying retries of the same write request; requests carrying it
+# may also be retried after a server error
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+JITTER_MODES = ("full", "equal", None)
+
+# Failure classifications; see classify()
+RETRY = "retry"
+RATE_LIMIT = "rate_limit"
+FATAL = "fatal"
+
+# Request exceptions raised for transient network failures
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+# ConnectionError subclasses raised for configuration problems (certificate
+# and proxy errors), which will fail again if retried
+FATAL_EXCEPTIONS = (
+    requests.exceptions.SSLError,
+    requests.exceptions.ProxyError,
+)
+
+
+def classify(failure):
+    """Classify a failed response, or request exception, for retrying.
+
+    Args:
+        failure(requests.Response, Exception): The error response returned by
+            the Webex Teams APIs, or the exception raised for the request.
+
+    Returns:
+        basestring: RATE_LIMIT for rate-limited (429) responses; RETRY for
+        transient server errors (502, 503, 504), connection errors and
+        timeouts; and FATAL for everything else (such as 400, 401, 403, 404
+        and 422 responses, and SSL and proxy errors), which will fail again
+        if retried.
+
+    """
+    if isinstance(failure, requests.Response):
+        if failure.status_code == RATE_LIMIT_RESPONSE_CODE:
+            return RATE_LIMIT
+        if failure.status_code in RETRYABLE_RESPONSE_CODES:
+            return RETRY
+        return FATAL
+
+    if isinstance(failure, FATAL_EXCEPTIONS):
+        return FATAL
+    if isinstance(failure, RETRYABLE_EXCEPTIONS):
+        return RETRY
+
+    return FATAL
+
+
+def is_replayable(request):
+    """Whether a request may be sent again without duplicating its effects.
+
+    Args:
+        request(requests.PreparedRequest): The request to be inspected.
+
+    Returns:
+        bool: True if the request method is idempotent, or the request
+        carries an `Idempotency-Key` header; and its body (if any) can be
+        sent again.  Streamed bodies (such as the multipart file uploads of
+        MessagesAPI.create()) are consumed when they are sent, and aren't
+        replayable.
+
+    """
+    return (
+        request is not None
+        and (request.body is None or isinstance(request.body, (bytes, str)))
+        and (request.method in IDEMPOTENT_METHODS
+             or IDEMPOTENCY_KEY_HEADER in request.headers)
+    )
+
+
+def parse_retry_after(value):
+    """Parse a `Retry-After` header value.
+
+    Per RFC 7231, the value may be either a number of seconds or an HTTP-date.
+
+    Args:
+        value(basestring): The `Retry-After` header value.
+
+    Returns:
+        float: The number of seconds to wait, or None if the value is missing
+        or cannot be parsed.
+
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parsed_date = email.utils.parsedate_tz(value)
+    if parsed_date is None:
+        return None
+
+    return max(0.0, email.utils.mktime_tz(parsed_date) - time.time())
+
+
+class RetryPolicy(object):
+    """Base class for retry policies.
+
+    A retry policy is consulted by the RestSession around every HTTP request
+    and decides whether, and after how long, a failed request is retried.
+    Subclasses override the methods they need; by default, rate-limited
+    requests are retried after the `Retry-After` period provided by Webex
+    Teams, and other failures are not retried.
+
+    """
+
+    def before_request(self):
+        """Called before each HTTP request is sent; may block to pace them."""
+        pass
+
+    def after_response(self, response, latency):
+        """Called with each HTTP response and its latency (seconds)."""
+        pass
+
+    def get_retry_delay(self, response, retries):
+        """Return the seconds to wait before retrying the request.
+
+        Args:
+            response(requests.Response): The failed response.
+            retries(int): The number of times the request has already been
+                retried; rate-limited (429) responses and other failures are
+                counted separately.
+
+        Returns:
+            float: The delay (in seconds) before the request is retried, or
+            None if the request should not be retried.  By default,
+            rate-limited (429) responses are retried after the `Retry-After`
+            period provided by Webex Teams, and other failures are not
+            retried.
+
+        """
+        if classify(response) == RATE_LIMIT:
+            retry_after = parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+            if retry_after is None:
+                retry_after = DEFAULT_RETRY_AFTER
+            return max(1, retry_after)
+
+        return None
+
+    def get_exception_retry_delay(self, exception, retries):
+        """Return the seconds to wait before retrying a request that raised.
+
+        Args:
+            exception(requests.exceptions.RequestException): The exception
+                raised while sending the request.
+            retries(int): The number of times the request has already been
+                retried.
+
+        Returns:
+            float: The delay (in seconds) before the request is retried, or
+            None if the exception should be re-raised.
+
+        """
+        return None
+
+
+class RetryAfterBackoffPolicy(RetryPolicy):
+    """Retry rate-limited requests and transient server errors.
+
+    Rate-limited (429) responses are retried after the `Retry-After` period
+    provided by Webex Teams.  Transient failures (502, 503 and 504 responses,
+    connection errors and timeouts) of idempotent requests, or requests
+    carrying an `Idempotency-Key` header, are retried up to `max_retries`
+    times, with a capped exponential backoff and (optionally) random jitter
+    between attempts.  Other failures are never retried; see classify().
+
+    """
+
+    def __init__(self, max_retries=5, base=0.5, cap=30, jitter="full"):
+        """Initialize a new RetryAfterBackoffPolicy.
+
+        Args:
+            max_retries(int): The maximum number of times a request is retried
+                after a server error.
+            base(int, float): The backoff delay (in seconds) before the first
+                retry; doubled for each subsequent retry.
+            cap(int, float): The maximum backoff delay (in seconds).
+            jitter(basestring): "full" waits a random time between zero and
+                the backoff delay, "equal" waits at least half of the backoff
+                delay, and None disables jitter.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `jitter` is not a supported jitter mode.
+
+        """
+        check_type(max_retries, int)
+        check_type(base, (int, float))
+        check_type(cap, (int, float))
+        if jitter not in JITTER_MODES:
+            raise ValueError(
+                "jitter must be one of {!r}; received: {!r}"
+                "".format(JITTER_MODES, jitter)
+            )
+
+        super(RetryAfterBackoffPolicy, self).__init__()
+
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+
+    def backoff(self, retries):
+        """Return the backoff delay (in seconds) before the next retry."""
+        delay = min(self.cap, self.base * 2 ** retries)
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        elif self.jitter == "equal":
+            return delay / 2 + random.uniform(0, delay / 2)
+        else:
+            return delay
+
+    def get_retry_delay(self, response, retries):
+        """Return the seconds to wait before retrying the request."""
+        classification = classify(response)
+
+        if classification == RATE_LIMIT:
+            return super(RetryAfterBackoffPolicy, self).get_retry_delay(
+                response, retries,
+            )
+
+        if (classification == RETRY
+                and is_replayable(response.request)
+                and retries < self.max_retries):
+            return self.backoff(retries)
+
+        return None
+
+    def get_exception_retry_delay(self, exception, retries):
+        """Return the seconds to wait before retrying a request that raised."""
+        if (classify(exception) == RETRY
+                and is_replayable(getattr(exception, "request", None))
+                and retries < self.max_retries):
+            return self.backoff(retries)
+
+        return None
+
+
+class AIMDPolicy(RetryAfterBackoffPolicy):
+    """Pace requests using additive-increase/multiplicative-decrease (AIMD).
+
+    The policy maintains a target request rate (requests per second).  The
+    rate is increased by `alpha` after each response received within the
+    `latency_target_s` latency target, and multiplied by `beta` after each
+    rate-limited or server error response, or when the latency target is
+    exceeded.  Requests are spaced to stay within the current rate.  Retries
+    are handled as in RetryAfterBackoffPolicy.
+
+    """
+
+    def __init__(self, alpha=0.5, beta=0.5, latency_target_s=1.0,
+                 initial_rate=5.0, min_rate=0.1, max_rate=50.0, **kwargs):
+        """Initialize a new AIMDPolicy.
+
+        Args:
+            alpha(int, float): The additive rate increase (requests/second).
+            beta(float): The multiplicative rate decrease factor (0 < beta <
+                1).
+            latency_target_s(int, float): The response latency (seconds)
+                above which the rate is decreased.
+            initial_rate(int, float): The initial request rate.
+            min_rate(int, float): The minimum request rate.
+            max_rate(int, float): The maximum request rate.
+            **kwargs: Passed on to RetryAfterBackoffPolicy.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a rate or factor is out of range.
+
+        """
+        check_type(alpha, (int, float))
+        check_type(beta, float)
+        check_type(latency_target_s, (int, float))
+        check_type(initial_rate, (int, float))
+        check_type(min_rate, (int, float))
+        check_type(max_rate, (int, float))
+        if not 0 < beta < 1:
+            raise ValueError("beta must be between 0 and 1")
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise ValueError(
+                "Rates must satisfy 0 < min_rate <= initial_rate <= max_rate"
+            )
+
+        super(AIMDPolicy, self).__init__(**kwargs)
+
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target_s = latency_target_s
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+
+        self._rate = float(initial_rate)
+        self._next_request_time = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """The current target request rate (requests per second)."""
+        return self._rate
+
+    def before_request(self):
+        """Wait until the current request rate allows another request."""
+        with self._lock:
+            now = time.time()
+            request_time = max(now, self._next_request_time)
+            self._next_request_time = request_time + 1 / self._rate
+
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    def after_response(self, response, latency):
+        """Adjust the request rate based on the response and its latency."""
+        congested = (
+            response.status_code == RATE_LIMIT_RESPONSE_CODE
+            or response.status_code in RETRYABLE_RESPONSE_CODES
+            or latency > self.latency_target_s
+        )
+
+        with self._lock:
+            if congested:
+                self._rate = max(self.min_rate, self._rate * self.beta)
+            else:
+                self._rate = min(self.max_rate, self._rate + self.alpha)
@@ -47,6 +47,11 @@ from datetime import datetime, timedelta, tzinfo
 
 from past.builtins import basestring
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import WEBEX_TEAMS_DATETIME_FORMAT
 from .exceptions import (
     ApiError, RateLimitError,
@@ -231,8 +236,12 @@ def extract_and_parse_json(response):
 
     Returns:
         The parsed JSON data as the appropriate native Python data type.
+        JSON objects are parsed as OrderedDicts, or as (insertion ordered)
+        dicts when the optional `orjson` package is installed.
 
     """
+    if orjson is not None:
+        return orjson.loads(response.content)
     return json.loads(response.text, object_hook=OrderedDict)
 
 